@@ -0,0 +1,82 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+DEFAULT_CACHE_PATH = Path(".cache/responses.sqlite")
+DEFAULT_TTL_SECONDS = 14 * 86400
+
+
+def _hash(key: Sequence[Any]) -> str:
+    """Derive a stable cache key from a sequence of JSON-serialisable parts."""
+    return hashlib.md5(
+        json.dumps(key, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+
+class ResponseCache:
+    """An exact-match, SQLite-backed cache for API responses.
+
+    Lookups are keyed on the md5 of the JSON-encoded key parts, so any change
+    to the model, prompt or payload results in a miss.
+    """
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            # Expired rows are never read again; drop them so the file stays bounded.
+            self._conn.execute(
+                "DELETE FROM responses WHERE expires_at < ?", (time.time(),)
+            )
+
+    def get(self, key: Sequence[Any]) -> Optional[Any]:
+        """Return the cached value for `key`, or None on a miss or expiry."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (_hash(key),)
+            ).fetchone()
+        if row is None or row[1] < time.time():
+            return None
+        return json.loads(row[0])
+
+    def set(
+        self, key: Sequence[Any], value: Any, ttl: float = DEFAULT_TTL_SECONDS
+    ) -> None:
+        """Store `value` under `key` for `ttl` seconds.
+
+        The cache is best-effort: if the database is locked or read-only, e.g.
+        by another run sharing the file, the value is not stored.
+        """
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                    (_hash(key), json.dumps(value), time.time() + ttl),
+                )
+        except sqlite3.OperationalError:
+            pass
+
+    async def aget(self, key: Sequence[Any]) -> Optional[Any]:
+        """Asynchronous variant of `get`, run off the event loop."""
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(
+        self, key: Sequence[Any], value: Any, ttl: float = DEFAULT_TTL_SECONDS
+    ) -> None:
+        """Asynchronous variant of `set`, run off the event loop."""
+        await asyncio.to_thread(self.set, key, value, ttl)
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,6 +1,7 @@
-import json
 from pathlib import Path
-from typing import Generator, TypedDict
+from typing import Generator, Iterator, TypedDict
+
+import orjson
 
 
 class QAItem(TypedDict):
@@ -10,30 +11,39 @@ class QAItem(TypedDict):
     answer: str
 
 
-def load_qa_dataset(path: Path) -> Generator[QAItem, None, None]:
+def load_qa_dataset(path: Path) -> Iterator[QAItem]:
     """Load the question-answer dataset from a JSONL file.
 
+    Lines are parsed lazily as the returned iterator is consumed, so memory
+    use stays constant regardless of dataset size. The path is checked up
+    front so a missing file is reported before any work starts.
+
     Args:
     ----
         path: The path to the .jsonl file.
 
-    Yields:
-    ------
-        A generator of QAItem objects.
+    Returns:
+    -------
+        An iterator of QAItem objects.
 
     """
     if not path.exists():
         raise FileNotFoundError(f"Dataset not found at path: {path}")
 
-    with open(path, "r", encoding="utf-8") as f:
+    return _iter_qa_items(path)
+
+
+def _iter_qa_items(path: Path) -> Generator[QAItem, None, None]:
+    """Yield each well-formed QAItem from the JSONL file at `path`."""
+    # Read bytes so orjson decodes UTF-8 itself, skipping a str copy per line.
+    with open(path, "rb") as f:
         for line in f:
-            if line.strip():
+            if not line.isspace():
                 try:
                     # Explicitly cast to QAItem for type checkers
-                    data: QAItem = json.loads(line)
+                    data: QAItem = orjson.loads(line)
                     yield data
-                except (json.JSONDecodeError, KeyError) as e:
-                    print(
-                        f"Warning: Skipping malformed line: {line.strip()} | Error: {e}"
-                    )
+                except (orjson.JSONDecodeError, KeyError) as e:
+                    text = line.decode("utf-8", errors="replace").strip()
+                    print(f"Warning: Skipping malformed line: {text} | Error: {e}")
                     continue
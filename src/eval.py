@@ -1,25 +1,93 @@
 import asyncio
 import os
+import re
 import sys
+from contextlib import AsyncExitStack
 from enum import Enum
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from types import TracebackType
+from typing import Any, AsyncIterator, Callable, Iterable, Optional, Sequence
 
 import httpx
+import orjson
+import tiktoken
 import typer
 from dotenv import load_dotenv
 from rich.console import Console
+from rich.markup import escape
 from rich.table import Table
 
 # --- Local Modules ---
+from src.cache import ResponseCache
 from src.dataset import QAItem, load_qa_dataset
-from src.metrics import hallucination_rate
+from src.metrics import hallucination_rate_from_count
+from src.results import append_result, load_results, open_results
+from src.retry import with_retry
 
 # --- Constants ---
 PPLX_API_URL = "https://api.perplexity.ai/chat/completions"
 PPLX_MODEL = "sonar"  # "llama-3.1-sonar-small-128k-online"
 OPENAI_API_URL = "https://api.openai.com/v1/chat/completions"
 GPT4O_MINI_MODEL = "gpt-4.1"
+# Tokenizer of the judge model, named directly so the logit bias does not
+# depend on tiktoken's model table knowing GPT4O_MINI_MODEL.
+JUDGE_ENCODING = "o200k_base"
+
+# Per-host caps on in-flight requests. These bound concurrency, not request
+# rate; rate limits are handled by `with_retry` backing off on 429 responses.
+PPLX_MAX_CONCURRENCY = 32
+OPENAI_MAX_CONCURRENCY = 64
+# Connection pool per provider client. Both APIs speak HTTP/2, so most requests
+# multiplex over a few long-lived connections instead of new TLS handshakes.
+HTTP_LIMITS = httpx.Limits(
+    max_connections=128, max_keepalive_connections=64, keepalive_expiry=60.0
+)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+# A fixed pool of workers pulls items from a bounded queue fed by the dataset
+# iterator, so memory stays proportional to the pool, not the dataset.
+EVAL_WORKERS = 64
+EVAL_QUEUE_SIZE = 256
+# Judge requests are grouped into one call of up to this many items, waiting at
+# most JUDGE_BATCH_WINDOW_SECONDS for a batch to fill. Set to 1 to disable.
+JUDGE_BATCH_SIZE = int(os.getenv("JUDGE_BATCH_SIZE", "10"))
+JUDGE_BATCH_WINDOW_SECONDS = 0.1
+# Answers shorter than this (after stripping) are failed without asking the judge.
+MIN_ANSWER_LENGTH = 3
+
+# Judge instructions are sent as a fixed system message ahead of the per-item
+# content. OpenAI only caches prompts of 1024 tokens or more, which these are
+# well short of, so this is for structure rather than a prompt-cache saving.
+JUDGE_SYSTEM_PROMPT = (
+    "You are a meticulous fact-checker. Compare the 'Model Answer' to the "
+    "'Ground Truth Answer'. A hallucination is a significant factual error, "
+    "contradiction, or failure to follow the translation instruction in EITHER "
+    "the English or Vietnamese part. Respond with ONLY 'YES' if it's a "
+    "hallucination or 'NO' if it is factually consistent and correctly "
+    "formatted/translated."
+)
+JUDGE_BATCH_SYSTEM_PROMPT = (
+    "You are a meticulous fact-checker. For each numbered item, compare the "
+    "'Model Answer' to the 'Ground Truth Answer'. A hallucination is a "
+    "significant factual error, contradiction, or failure to follow the "
+    "translation instruction in EITHER the English or Vietnamese part. Respond "
+    "with exactly one line per item, in order, each containing ONLY 'YES' if it's "
+    "a hallucination or 'NO' if it is factually consistent and correctly "
+    "formatted/translated."
+)
+# Per-item judge content; `!r` quotes and escapes each field so embedded quotes or
+# newlines cannot blur the boundaries between them.
+JUDGE_PROMPT_TEMPLATE = (
+    "Question: {question!r}\n\n"
+    "Ground Truth Answer: {gt!r}\n\n"
+    "Model Answer: {ma!r}"
+)
+JUDGE_BATCH_ITEM_TEMPLATE = (
+    "\n\n{index}) Question: {question!r}\n"
+    "Ground Truth Answer: {gt!r}\n"
+    "Model Answer: {ma!r}"
+)
 
 
 class ExperimentMode(str, Enum):
@@ -30,8 +98,59 @@ class ExperimentMode(str, Enum):
     RAG_ASSISTED = "rag-assisted"
 
 
+# Perplexity system prompt per mode, built once at import time.
+SYSTEM_PROMPTS: dict[ExperimentMode, str] = {
+    ExperimentMode.BASELINE: (
+        "You are a helpful AI assistant. Answer the user's question, then"
+        "translate it to Vietnamese."
+    ),
+    ExperimentMode.PROMPT_TUNED: (
+        "You are a hyper-precise bilingual expert. You will strictly follow a "
+        "two-part format. First, provide a complete, factual answer in English "
+        "inside <english_answer> XML tags. Second, provide a direct and accurate "
+        "translation of that English answer into Vietnamese inside "
+        "<vietnamese_translation> XML tags. Do not add any other commentary. "
+        "Here is an example of the required format:\n\n"
+        "EXAMPLE QUESTION: What is a CPU?\n"
+        "EXAMPLE RESPONSE:\n"
+        "<english_answer>\nA CPU, or Central Processing Unit, is the primary "
+        "component of a computer that executes instructions.\n"
+        "</english_answer>\n"
+        "<vietnamese_translation>\n"
+        "CPU, hay Bộ xử lý trung tâm, là thành phần chính của máy tính thực hiện "
+        "các lệnh.\n"
+        "</vietnamese_translation>"
+    ),
+    ExperimentMode.RAG_ASSISTED: (
+        "You are a hyper-precise bilingual expert. Use ONLY the provided context "
+        "to answer the question. Strictly follow the two-part format: first, "
+        "the English answer in <english_answer> tags. Second, the Vietnamese "
+        "translation in <vietnamese_translation> tags."
+    ),
+}
+
+# Perplexity user message per mode. RAG-assisted mode supplies the ground truth
+# as context; the other modes send the bare question.
+QUESTION_BUILDERS: dict[ExperimentMode, Callable[[QAItem], str]] = {
+    ExperimentMode.BASELINE: lambda item: item["question"],
+    ExperimentMode.PROMPT_TUNED: lambda item: item["question"],
+    ExperimentMode.RAG_ASSISTED: lambda item: (
+        f"CONTEXT:\n---\n{item['answer']}\n---\n\nQUESTION: {item['question']}"
+    ),
+}
+
+
+class PerplexityError(Exception):
+    """Raised when the Perplexity API cannot produce an answer."""
+
+
 # --- Setup ---
 load_dotenv()
+if sys.platform != "win32":
+    import uvloop
+
+    # libuv-backed event loop; asyncio.run picks it up through the policy.
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 app = typer.Typer()
 console = Console()
 
@@ -53,43 +172,19 @@ OPENAI_HEADERS: dict[str, str] = {
 
 # --- Core API Functions ---
 async def query_perplexity(
-    client: httpx.AsyncClient, question: str, mode: ExperimentMode
+    client: httpx.AsyncClient,
+    question: str,
+    mode: ExperimentMode,
+    semaphore: asyncio.Semaphore,
+    cache: Optional[ResponseCache] = None,
 ) -> str:
-    """Query the Perplexity API with a given question."""
-    system_prompt = ""
-    user_question = question
-
-    if mode == ExperimentMode.BASELINE:
-        system_prompt = (
-            "You are a helpful AI assistant. Answer the user's question, then"
-            "translate it to Vietnamese."
-        )
-    elif mode == ExperimentMode.PROMPT_TUNED:
-        system_prompt = (
-            "You are a hyper-precise bilingual expert. You will strictly follow a "
-            "two-part format. First, provide a complete, factual answer in English "
-            "inside <english_answer> XML tags. Second, provide a direct and accurate "
-            "translation of that English answer into Vietnamese inside "
-            "<vietnamese_translation> XML tags. Do not add any other commentary. "
-            "Here is an example of the required format:\n\n"
-            "EXAMPLE QUESTION: What is a CPU?\n"
-            "EXAMPLE RESPONSE:\n"
-            "<english_answer>\nA CPU, or Central Processing Unit, is the primary "
-            "component of a computer that executes instructions.\n"
-            "</english_answer>\n"
-            "<vietnamese_translation>\n"
-            "CPU, hay Bộ xử lý trung tâm, là thành phần chính của máy tính thực hiện "
-            "các lệnh.\n"
-            "</vietnamese_translation>"
-        )
-    elif mode == ExperimentMode.RAG_ASSISTED:
-        system_prompt = (
-            "You are a hyper-precise bilingual expert. Use ONLY the provided context "
-            "to answer the question. Strictly follow the two-part format: first, "
-            "the English answer in <english_answer> tags. Second, the Vietnamese "
-            "translation in <vietnamese_translation> tags."
-        )
+    """Query the Perplexity API with a given question.
 
+    Raises `PerplexityError` once retries are exhausted, so callers can tell a
+    failed query apart from a real answer.
+    """
+    system_prompt = SYSTEM_PROMPTS[mode]
+    user_question = question
     payload: dict[str, Any] = {
         "model": PPLX_MODEL,
         "messages": [
@@ -97,70 +192,417 @@ async def query_perplexity(
             {"role": "user", "content": user_question},
         ],
     }
+    cache_key = ("pplx", PPLX_MODEL, mode.value, system_prompt, user_question)
+    if cache is not None:
+        cached: Optional[str] = await cache.aget(cache_key)
+        if cached is not None:
+            return cached
+
+    async def send() -> httpx.Response:
+        async with semaphore:
+            response = await client.post(
+                PPLX_API_URL, json=payload, headers=PPLX_HEADERS, timeout=120.0
+            )
+        return response.raise_for_status()
+
     try:
-        response = await client.post(
-            PPLX_API_URL, json=payload, headers=PPLX_HEADERS, timeout=120.0
-        )
-        response.raise_for_status()
-        return response.json()["choices"][0]["message"]["content"]
+        response = await with_retry(send)
+        data = orjson.loads(response.content)
+        content: str = data["choices"][0]["message"]["content"]
     except Exception as e:
-        return f"An unexpected error occurred in Perplexity query: {e}"
+        raise PerplexityError(
+            f"An unexpected error occurred in Perplexity query: {e}"
+        ) from e
+
+    if cache is not None:
+        await cache.aset(cache_key, content)
+    return content
+
+
+@lru_cache(maxsize=None)
+def _verdict_logit_bias() -> dict[str, int]:
+    """Return a logit_bias restricting the judge's first token to YES or NO.
+
+    The tokenizer is downloaded on first use; if that fails the judge falls
+    back to an unconstrained reply and an empty bias is returned.
+    """
+    try:
+        encoding = tiktoken.get_encoding(JUDGE_ENCODING)
+    except OSError as e:  # Includes requests' network errors.
+        console.print(
+            "[yellow]Tokenizer unavailable, judge output is unconstrained: "
+            f"{escape(str(e))}[/yellow]"
+        )
+        return {}
+    return {str(encoding.encode(word)[0]): 100 for word in ("YES", "NO")}
+
+
+async def _first_stream_token(lines: AsyncIterator[str]) -> str:
+    """Return the first non-blank content delta from a chat completion stream."""
+    async for line in lines:
+        if not line.startswith("data: "):
+            continue
+        data = line[len("data: ") :]
+        if data == "[DONE]":
+            break
+        for choice in orjson.loads(data).get("choices", []):
+            token = (choice.get("delta") or {}).get("content")
+            if token and token.strip():
+                return str(token)
+    return ""
+
+
+def _judge_cache_key(
+    question: str, correct_answer: str, model_answer: str
+) -> tuple[str, ...]:
+    """Build the cache key for a judge verdict.
+
+    The judge prompts are part of the key, so editing them invalidates the
+    verdicts cached under the old wording.
+    """
+    return (
+        "judge",
+        GPT4O_MINI_MODEL,
+        JUDGE_SYSTEM_PROMPT,
+        JUDGE_PROMPT_TEMPLATE,
+        JUDGE_BATCH_SYSTEM_PROMPT,
+        JUDGE_BATCH_ITEM_TEMPLATE,
+        question,
+        correct_answer,
+        model_answer,
+    )
 
 
 async def is_hallucinated(
-    client: httpx.AsyncClient, question: str, correct_answer: str, model_answer: str
+    client: httpx.AsyncClient,
+    question: str,
+    correct_answer: str,
+    model_answer: str,
+    semaphore: asyncio.Semaphore,
+    cache: Optional[ResponseCache] = None,
 ) -> bool:
     """Use GPT-4o-mini to fact-check if the model's answer is a hallucination."""
-    prompt = (
-        "You are a meticulous fact-checker. Compare the 'Model Answer' to the "
-        "'Ground Truth Answer'. A hallucination is a significant factual error, "
-        "contradiction, or failure to follow the translation instruction in EITHER "
-        "the English or Vietnamese part. Respond with ONLY 'YES' if it's a "
-        "hallucination or 'NO' if it is factually consistent and correctly "
-        "formatted/translated.\n\n"
-        f'Question: "{question}"\n\n'
-        f'Ground Truth Answer: "{correct_answer}"\n\n'
-        f'Model Answer: "{model_answer}"'
+    cache_key = _judge_cache_key(question, correct_answer, model_answer)
+    if cache is not None:
+        cached: Optional[bool] = await cache.aget(cache_key)
+        if cached is not None:
+            return cached
+
+    prompt = JUDGE_PROMPT_TEMPLATE.format(
+        question=question, gt=correct_answer, ma=model_answer
     )
+    logit_bias = _verdict_logit_bias()
     payload: dict[str, Any] = {
         "model": GPT4O_MINI_MODEL,
-        "messages": [{"role": "user", "content": prompt}],
+        "messages": [
+            {"role": "system", "content": JUDGE_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ],
         "temperature": 0,
-        "max_tokens": 5,
+        # With the bias in place the reply is exactly one YES or NO token.
+        "max_tokens": 1 if logit_bias else 5,
+        # The verdict is read from the first streamed delta, ahead of the rest of
+        # the response framing.
+        "stream": True,
     }
+    if logit_bias:
+        payload["logit_bias"] = logit_bias
+
+    async def send() -> str:
+        async with semaphore:
+            async with client.stream(
+                "POST",
+                OPENAI_API_URL,
+                json=payload,
+                headers=OPENAI_HEADERS,
+                timeout=30.0,
+            ) as response:
+                response.raise_for_status()
+                lines = response.aiter_lines()
+                token = await _first_stream_token(lines)
+                if response.http_version != "HTTP/2":
+                    # Closing an HTTP/1.1 body early would drop the pooled
+                    # connection; an HTTP/2 stream is simply reset instead.
+                    async for _ in lines:
+                        pass
+        if not token:
+            # E.g. a content_filter finish; fail it rather than read it as NO.
+            raise ValueError("judge stream ended without a verdict token")
+        return token
+
     try:
-        response = await client.post(
-            OPENAI_API_URL, json=payload, headers=OPENAI_HEADERS, timeout=30.0
-        )
-        response.raise_for_status()
-        data = response.json()
-        content = data["choices"][0]["message"]["content"].strip().upper()
-        return "YES" in content
+        content = await with_retry(send)
     except Exception as e:
         console.print(f"[bold red]GPT-4o Mini fact-check failed: {e}[/bold red]")
         return True
 
+    verdict = content.strip().upper().startswith("Y")
+    if cache is not None:
+        await cache.aset(cache_key, verdict)
+    return verdict
+
+
+_VERDICT_LINE = re.compile(r"^(?:\d+\s*[).:-]?\s*)?(YES|NO)\b")
+
+
+def parse_judge_verdicts(content: str, count: int) -> list[bool]:
+    """Parse a batched judge reply of one YES/NO line per item into booleans.
+
+    Args:
+    ----
+        content: The raw message content returned by the judge.
+        count: The number of items that were sent in the batch.
+
+    Returns:
+    -------
+        One boolean per item, True where the judge answered YES.
+
+    """
+    verdicts: list[bool] = []
+    for line in content.splitlines():
+        line = line.strip().upper()
+        if not line:
+            continue
+        match = _VERDICT_LINE.match(line)
+        if match is None:
+            raise ValueError(f"Unparseable judge verdict line: {line!r}")
+        verdicts.append(match.group(1) == "YES")
+
+    if len(verdicts) != count:
+        raise ValueError(f"Expected {count} judge verdicts, got {len(verdicts)}")
+    return verdicts
+
+
+async def judge_batch(
+    client: httpx.AsyncClient,
+    items: Sequence[tuple[str, str, str]],
+    semaphore: asyncio.Semaphore,
+) -> list[bool]:
+    """Fact-check several (question, ground truth, model answer) triples at once.
+
+    Unlike `is_hallucinated`, failures are raised rather than counted as
+    hallucinations, so the caller can decide how to recover.
+    """
+    prompt = f"There are {len(items)} items. Respond with {len(items)} lines."
+    prompt += "".join(
+        JUDGE_BATCH_ITEM_TEMPLATE.format(
+            index=i, question=question, gt=correct_answer, ma=model_answer
+        )
+        for i, (question, correct_answer, model_answer) in enumerate(items, start=1)
+    )
+    payload: dict[str, Any] = {
+        "model": GPT4O_MINI_MODEL,
+        "messages": [
+            {"role": "system", "content": JUDGE_BATCH_SYSTEM_PROMPT},
+            {"role": "user", "content": prompt},
+        ],
+        "temperature": 0,
+        # "N. YES" plus a newline is about four tokens; allow slack for extra spacing.
+        "max_tokens": 6 * len(items) + 4,
+    }
+
+    async def send() -> httpx.Response:
+        async with semaphore:
+            response = await client.post(
+                OPENAI_API_URL, json=payload, headers=OPENAI_HEADERS, timeout=60.0
+            )
+        return response.raise_for_status()
+
+    response = await with_retry(send)
+    data = orjson.loads(response.content)
+    content: str = data["choices"][0]["message"]["content"]
+    return parse_judge_verdicts(content, len(items))
+
+
+# --- Judge Batching ---
+
+
+_JudgeRequest = tuple[str, str, str, "asyncio.Future[bool]"]
+
+
+class JudgeBatcher:
+    """Group concurrent judge requests into batched fact-check calls.
+
+    Callers await `judge()` as they would `is_hallucinated`; a background
+    worker drains the queue into batches of up to `batch_size` items, waiting
+    at most `window` seconds for a batch to fill before sending it.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        cache: Optional[ResponseCache] = None,
+        batch_size: int = JUDGE_BATCH_SIZE,
+        window: float = JUDGE_BATCH_WINDOW_SECONDS,
+    ) -> None:
+        self._client = client
+        self._semaphore = semaphore
+        self._cache = cache
+        self._batch_size = max(batch_size, 1)
+        self._window = window
+        self._queue: asyncio.Queue[_JudgeRequest] = asyncio.Queue()
+        self._batch_full = asyncio.Event()
+        self._flushes: set[asyncio.Task[None]] = set()
+        self._worker: Optional[asyncio.Task[None]] = None
+
+    async def __aenter__(self) -> "JudgeBatcher":
+        """Start the background batching worker."""
+        self._worker = asyncio.ensure_future(self._run())
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        """Stop the worker and cancel any batches still in flight."""
+        tasks = [*self._flushes, *([self._worker] if self._worker else [])]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def judge(
+        self, question: str, correct_answer: str, model_answer: str
+    ) -> bool:
+        """Return whether `model_answer` is a hallucination, batching the call."""
+        cache_key = _judge_cache_key(question, correct_answer, model_answer)
+        if self._cache is not None:
+            cached: Optional[bool] = await self._cache.aget(cache_key)
+            if cached is not None:
+                return cached
+
+        future: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((question, correct_answer, model_answer, future))
+        if self._queue.qsize() >= self._batch_size - 1:
+            self._batch_full.set()
+        return await future
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            if self._queue.qsize() < self._batch_size - 1:
+                self._batch_full.clear()
+                try:
+                    await asyncio.wait_for(self._batch_full.wait(), self._window)
+                except asyncio.TimeoutError:
+                    pass
+            while len(batch) < self._batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            task = asyncio.ensure_future(self._flush(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: list[_JudgeRequest]) -> None:
+        # Flushes run as detached tasks, so any error must still resolve the
+        # callers' futures: an unexpected one fails the batch as hallucinated,
+        # and cancellation cancels the pending calls.
+        try:
+            await self._judge_batch(batch)
+        except Exception as e:
+            console.print(f"[bold red]GPT-4o Mini fact-check failed: {e}[/bold red]")
+            for *_, future in batch:
+                if not future.done():
+                    future.set_result(True)
+        except BaseException:
+            for *_, future in batch:
+                future.cancel()
+            raise
+
+    async def _judge_batch(self, batch: list[_JudgeRequest]) -> None:
+        if len(batch) == 1:
+            question, correct_answer, model_answer, future = batch[0]
+            verdict = await is_hallucinated(
+                self._client,
+                question,
+                correct_answer,
+                model_answer,
+                self._semaphore,
+                self._cache,
+            )
+            if not future.done():
+                future.set_result(verdict)
+            return
+
+        try:
+            verdicts = await judge_batch(
+                self._client, [request[:3] for request in batch], self._semaphore
+            )
+        except ValueError:
+            # The judge did not return one verdict per item; re-ask one by one.
+            await asyncio.gather(*(self._flush([request]) for request in batch))
+            return
+
+        for (*_, future), verdict in zip(batch, verdicts):
+            if not future.done():
+                future.set_result(verdict)
+        if self._cache is not None:
+            for (question, correct_answer, model_answer, _), verdict in zip(
+                batch, verdicts
+            ):
+                await self._cache.aset(
+                    _judge_cache_key(question, correct_answer, model_answer), verdict
+                )
+
 
 # --- Orchestration ---
 
 
+def build_client(name: str) -> httpx.AsyncClient:
+    """Create a pooled HTTP/2 client for one provider.
+
+    The negotiated HTTP version is logged on the client's first response, to
+    confirm that HTTP/2 multiplexing is actually in use.
+    """
+    logged = False
+
+    async def log_http_version(response: httpx.Response) -> None:
+        nonlocal logged
+        if not logged:
+            logged = True
+            console.print(f"[dim]{name} connection: {response.http_version}[/dim]")
+
+    return httpx.AsyncClient(
+        http2=True,
+        limits=HTTP_LIMITS,
+        timeout=HTTP_TIMEOUT,
+        event_hooks={"response": [log_http_version]},
+    )
+
+
 async def evaluate_item(
-    client: httpx.AsyncClient, item: QAItem, mode: ExperimentMode
-) -> tuple[QAItem, str, bool]:
-    """Run the full evaluation pipeline for a single Q&A item based on the mode."""
-    question_payload = item["question"]
-
-    if mode == ExperimentMode.RAG_ASSISTED:
-        context = item["answer"]
-        question_payload = (
-            f"CONTEXT:\n---\n{context}\n---\n\n" f"QUESTION: {item['question']}"
+    pplx_client: httpx.AsyncClient,
+    item: QAItem,
+    mode: ExperimentMode,
+    pplx_semaphore: asyncio.Semaphore,
+    judge: JudgeBatcher,
+    cache: Optional[ResponseCache] = None,
+) -> tuple[QAItem, str, bool, bool]:
+    """Run the full evaluation pipeline for a single Q&A item based on the mode.
+
+    Returns (item, model_answer, is_hallucinated, failed), where `failed` marks
+    a Perplexity query that errored out rather than producing an answer.
+    """
+    question_payload = QUESTION_BUILDERS[mode](item)
+
+    try:
+        model_answer = await query_perplexity(
+            pplx_client, question_payload, mode, pplx_semaphore, cache
         )
+    except PerplexityError as e:
+        # A failed query is counted as a hallucination without paying the judge.
+        console.print(f"[bold red]{escape(str(e))}[/bold red]")
+        return (item, str(e), True, True)
+
+    if len(model_answer.strip()) < MIN_ANSWER_LENGTH:
+        return (item, model_answer, True, False)
 
-    model_answer = await query_perplexity(client, question_payload, mode)
-    hallucination_result = await is_hallucinated(
-        client, item["question"], item["answer"], model_answer
+    hallucination_result = await judge.judge(
+        item["question"], item["answer"], model_answer
     )
-    return (item, model_answer, hallucination_result)
+    return (item, model_answer, hallucination_result, False)
 
 
 @app.command()
@@ -181,6 +623,20 @@ def evaluate(
     verbose: bool = typer.Option(
         False, "--verbose", "-v", help="Print full question and answer details."
     ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Bypass the local response cache."
+    ),
+    cache_answers: bool = typer.Option(
+        False,
+        "--cache-answers",
+        help="Also replay cached Perplexity answers instead of querying live.",
+    ),
+    output: Optional[Path] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Append results to this JSONL file and skip questions already in it.",
+    ),
 ) -> None:
     """Evaluate Perplexity AI on a mixed-language dataset for hallucinations."""
     if not PPLX_API_KEY or not OPENAI_API_KEY:
@@ -194,30 +650,127 @@ def evaluate(
     console.print(f"Mode: [bold yellow]{mode.value}[/bold yellow]")
 
     try:
-        dataset = list(load_qa_dataset(data_path))
+        dataset: Iterable[QAItem] = load_qa_dataset(data_path)
         if limit > 0:
-            dataset = dataset[:limit]
+            dataset = islice(dataset, limit)
     except FileNotFoundError as e:
         console.print(f"[bold red]Error: {e}[/bold red]")
         sys.exit(1)
 
-    asyncio.run(run_evaluation_tasks(dataset, verbose, mode))
+    cache = None if no_cache else ResponseCache()
+    try:
+        asyncio.run(
+            run_evaluation_tasks(
+                dataset, verbose, mode, cache, output, cache_answers=cache_answers
+            )
+        )
+    finally:
+        if cache is not None:
+            cache.close()
 
 
 async def run_evaluation_tasks(
-    dataset: list[QAItem], verbose: bool, mode: ExperimentMode
+    dataset: Iterable[QAItem],
+    verbose: bool,
+    mode: ExperimentMode,
+    cache: Optional[ResponseCache] = None,
+    output: Optional[Path] = None,
+    cache_answers: bool = False,
 ) -> None:
-    """Run all tasks and display results."""
-    hallucination_results: list[bool] = []
+    """Run all tasks and display results.
+
+    Judge verdicts are always served from `cache` when given. Perplexity answers
+    are only cached with `cache_answers`, since the harness exists to track a
+    live, changing model.
+    """
+    answer_cache = cache if cache_answers else None
+    # Results complete out of order, so each is tagged with its dataset position
+    # and sorted back into dataset order before display.
+    indexed_results: list[tuple[int, tuple[QAItem, str, bool]]] = []
+    # Results already in `output`, reused only for items this dataset yields.
+    finished = {
+        (item["question"], item["answer"]): (item, model_answer, hallucinated)
+        for item, model_answer, hallucinated in (
+            load_results(output, mode.value) if output is not None else []
+        )
+    }
+    resumed = 0
+
+    pplx_semaphore = asyncio.Semaphore(PPLX_MAX_CONCURRENCY)
+    openai_semaphore = asyncio.Semaphore(OPENAI_MAX_CONCURRENCY)
+
+    async with AsyncExitStack() as stack:
+        pplx_client = await stack.enter_async_context(build_client("Perplexity"))
+        openai_client = await stack.enter_async_context(build_client("OpenAI"))
+        judge = await stack.enter_async_context(
+            JudgeBatcher(openai_client, openai_semaphore, cache)
+        )
+        out = stack.enter_context(open_results(output)) if output is not None else None
+        queue: asyncio.Queue[Optional[tuple[int, QAItem]]] = asyncio.Queue(
+            maxsize=EVAL_QUEUE_SIZE
+        )
 
-    all_results: list[tuple[QAItem, str, bool]] = []
+        async def produce() -> None:
+            nonlocal resumed
+            for index, item in enumerate(dataset):
+                previous = finished.get((item["question"], item["answer"]))
+                if previous is None:
+                    await queue.put((index, item))
+                else:
+                    indexed_results.append((index, previous))
+                    resumed += 1
+            for _ in range(EVAL_WORKERS):
+                await queue.put(None)
 
-    async with httpx.AsyncClient() as client:
-        tasks = [evaluate_item(client, item, mode) for item in dataset]
         with console.status(
             f"[bold yellow]Evaluating in {mode.value} mode...[/bold yellow]"
-        ):
-            all_results = await asyncio.gather(*tasks)
+        ) as status:
+
+            async def consume() -> None:
+                while (entry := await queue.get()) is not None:
+                    index, item = entry
+                    _, model_answer, hallucinated, failed = await evaluate_item(
+                        pplx_client, item, mode, pplx_semaphore, judge, answer_cache
+                    )
+                    indexed_results.append((index, (item, model_answer, hallucinated)))
+                    if out is not None:
+                        append_result(
+                            out, mode.value, item, model_answer, hallucinated, failed
+                        )
+                    status.update(
+                        f"[bold yellow]Evaluating in {mode.value} mode... "
+                        f"({len(indexed_results)} done)[/bold yellow]"
+                    )
+
+            await asyncio.gather(produce(), *(consume() for _ in range(EVAL_WORKERS)))
+
+    if resumed:
+        console.print(f"Resumed [bold]{resumed}[/bold] results from {output}")
+    indexed_results.sort(key=lambda entry: entry[0])
+    all_results = [result for _, result in indexed_results]
+    total = len(all_results)
+    hallucination_count = _print_results(all_results, verbose)
+
+    # Final Report
+    final_rate = hallucination_rate_from_count(hallucination_count, total)
+    console.print("\n" + "=" * 40 + "\n")
+    summary_table = Table(title=f"📊 Final Report ({mode.value})", show_header=False)
+    summary_table.add_row("Total Questions Evaluated:", str(total))
+    summary_table.add_row("Total Hallucinations Detected:", str(hallucination_count))
+    summary_table.add_row(
+        "[bold yellow]Hallucination Rate:[/bold yellow]",
+        f"[bold yellow]{final_rate:.2f}%[/bold yellow]",
+    )
+    console.print(summary_table)
+
+
+def _print_results(all_results: list[tuple[QAItem, str, bool]], verbose: bool) -> int:
+    """Print the per-question results and return the number of hallucinations.
+
+    The count is taken in the same pass that renders the rows, so the final
+    report does not have to walk the results again.
+    """
+    count = 0
 
     # Display results based on verbosity
     if verbose:
@@ -227,7 +780,7 @@ async def run_evaluation_tasks(
         table.add_column("Model Answer", style="white", no_wrap=False)
         table.add_column("Hallucination?", style="magenta", justify="center")
         for item, model_answer, is_hallucinated_result in all_results:
-            hallucination_results.append(is_hallucinated_result)
+            count += is_hallucinated_result
             table.add_row(
                 item["question"],
                 item["answer"],
@@ -239,28 +792,21 @@ async def run_evaluation_tasks(
         console.print(table)
     else:
         console.print("\n[bold]Quick Results:[/bold]")
+        # Rendered in a single print: one console write per line dominates the
+        # non-API wall time on large datasets.
+        lines: list[str] = []
         for i, (item, _, is_hallucinated_result) in enumerate(all_results):
-            hallucination_results.append(is_hallucinated_result)
+            count += is_hallucinated_result
             status_icon = (
                 "[bold red]✖ FAIL[/]"
                 if is_hallucinated_result
                 else "[bold green]✔ PASS[/]"
             )
-            console.print(f"{status_icon} - Q{i+1}: {item['question'][:80]}...")
+            lines.append(f"{status_icon} - Q{i + 1}: {item['question'][:80]}...")
+        if lines:
+            console.print("\n".join(lines), highlight=False)
 
-    # Final Report
-    final_rate = hallucination_rate([res[2] for res in all_results])
-    console.print("\n" + "=" * 40 + "\n")
-    summary_table = Table(title=f"📊 Final Report ({mode.value})", show_header=False)
-    summary_table.add_row("Total Questions Evaluated:", str(len(dataset)))
-    summary_table.add_row(
-        "Total Hallucinations Detected:", str(sum(res[2] for res in all_results))
-    )
-    summary_table.add_row(
-        "[bold yellow]Hallucination Rate:[/bold yellow]",
-        f"[bold yellow]{final_rate:.2f}%[/bold yellow]",
-    )
-    console.print(summary_table)
+    return count
 
 
 if __name__ == "__main__":
@@ -13,10 +13,24 @@ def hallucination_rate(results: Sequence[bool]) -> float:
         The percentage of hallucinations. Returns 0.0 if the sequence is empty.
 
     """
-    if not results:
-        return 0.0
+    # Sequence.count runs in C for lists and tuples, unlike a generator sum.
+    return hallucination_rate_from_count(results.count(True), len(results))
+
+
+def hallucination_rate_from_count(hallucination_count: int, total_items: int) -> float:
+    """Calculate the hallucination rate as a percentage from precomputed counts.
+
+    Args:
+    ----
+        hallucination_count: The number of results flagged as hallucinations.
+        total_items: The total number of results.
 
-    hallucination_count: int = sum(1 for result in results if result)
-    total_items: int = len(results)
+    Returns:
+    -------
+        The percentage of hallucinations. Returns 0.0 if `total_items` is 0.
+
+    """
+    if total_items == 0:
+        return 0.0
 
     return (hallucination_count / total_items) * 100.0
@@ -0,0 +1,84 @@
+import os
+from pathlib import Path
+from typing import BinaryIO, TypedDict
+
+import orjson
+
+from src.dataset import QAItem
+
+
+class ResultRecord(TypedDict):
+    """A typed dictionary representing one persisted evaluation result."""
+
+    mode: str
+    question: str
+    answer: str
+    model_answer: str
+    hallucinated: bool
+    error: bool
+
+
+def load_results(path: Path, mode: str) -> list[tuple[QAItem, str, bool]]:
+    """Load the results previously written for `mode` from a JSONL file.
+
+    Args:
+    ----
+        path: The path to the results .jsonl file. It may not exist yet.
+        mode: The experiment mode whose results should be returned.
+
+    Returns:
+    -------
+        A list of (item, model_answer, is_hallucinated) tuples, in file order.
+        A truncated trailing line left by a crash is ignored, as are records of
+        failed queries, so that resuming retries them.
+
+    """
+    if not path.exists():
+        return []
+
+    results: list[tuple[QAItem, str, bool]] = []
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                record: ResultRecord = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+            if record["mode"] == mode and not record.get("error", False):
+                item = QAItem(question=record["question"], answer=record["answer"])
+                results.append((item, record["model_answer"], record["hallucinated"]))
+    return results
+
+
+def open_results(path: Path) -> BinaryIO:
+    """Open a results file for appending, ready to write a fresh record.
+
+    If a crash left a partial last line, a newline is written first so the
+    next record starts on its own line instead of being glued onto it.
+    """
+    f = open(path, "a+b")
+    if f.seek(0, os.SEEK_END) > 0:
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b"\n":
+            f.write(b"\n")
+    return f
+
+
+def append_result(
+    f: BinaryIO,
+    mode: str,
+    item: QAItem,
+    model_answer: str,
+    hallucinated: bool,
+    error: bool = False,
+) -> None:
+    """Append a single result to an open results file and flush it to disk."""
+    record = ResultRecord(
+        mode=mode,
+        question=item["question"],
+        answer=item["answer"],
+        model_answer=model_answer,
+        hallucinated=hallucinated,
+        error=error,
+    )
+    f.write(orjson.dumps(record) + b"\n")
+    f.flush()
@@ -0,0 +1,112 @@
+import asyncio
+import random
+import re
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+MAX_ATTEMPTS = 5
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_CAP_SECONDS = 30.0
+# Upper bound on server-supplied delays, so a bogus or far-off reset time
+# cannot stall a worker indefinitely.
+MAX_SERVER_DELAY_SECONDS = 60.0
+RETRYABLE_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def _parse_duration(value: str) -> Optional[float]:
+    """Parse a rate-limit duration such as "20ms", "1s" or "6m0s" into seconds."""
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if not parts or "".join(n + u for n, u in parts) != value:
+        return None
+    return sum(float(n) * _DURATION_UNITS[u] for n, u in parts)
+
+
+def _parse_retry_after(value: str) -> Optional[float]:
+    """Parse a Retry-After header given either in seconds or as an HTTP date."""
+    seconds = _parse_duration(value)
+    if seconds is not None:
+        return seconds
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """Compute how long to wait before retrying a failed request.
+
+    Server hints win over local backoff: `Retry-After` is honoured first,
+    then `x-ratelimit-reset-requests` when the request quota is exhausted;
+    either is capped at `MAX_SERVER_DELAY_SECONDS`. Otherwise an exponential
+    backoff with full jitter is used.
+
+    Args:
+    ----
+        attempt: The 1-based number of the attempt that just failed.
+        response: The failed response, if the server sent one.
+
+    Returns:
+    -------
+        The number of seconds to sleep before the next attempt.
+
+    """
+    if response is not None:
+        retry_after = response.headers.get("retry-after")
+        if retry_after is not None:
+            delay = _parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, MAX_SERVER_DELAY_SECONDS)
+
+        remaining = response.headers.get("x-ratelimit-remaining-requests")
+        reset = response.headers.get("x-ratelimit-reset-requests")
+        if remaining == "0" and reset is not None:
+            delay = _parse_duration(reset)
+            if delay is not None:
+                return min(delay, MAX_SERVER_DELAY_SECONDS)
+
+    ceiling = min(BACKOFF_CAP_SECONDS, BACKOFF_BASE_SECONDS * 2 ** (attempt - 1))
+    return random.uniform(0, ceiling)
+
+
+async def with_retry(
+    send: Callable[[], Awaitable[T]], attempts: int = MAX_ATTEMPTS
+) -> T:
+    """Await `send()`, retrying rate limits, server errors and transport errors.
+
+    `send` must raise `httpx.HTTPStatusError` for error responses, e.g. by
+    calling `response.raise_for_status()`. Client errors other than those in
+    `RETRYABLE_STATUS_CODES` are raised immediately, as is the last failure
+    once `attempts` is exhausted.
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            return await send()
+        except httpx.HTTPStatusError as e:
+            if (
+                attempt == attempts
+                or e.response.status_code not in RETRYABLE_STATUS_CODES
+            ):
+                raise
+            delay = retry_delay(attempt, e.response)
+        except httpx.TransportError:
+            if attempt == attempts:
+                raise
+            delay = retry_delay(attempt)
+        await asyncio.sleep(delay)
+
+    raise RuntimeError("with_retry requires at least one attempt")
@@ -0,0 +1,59 @@
+import sqlite3
+from pathlib import Path
+
+from src.cache import ResponseCache
+
+
+def test_cache_miss_returns_none(tmp_path: Path) -> None:
+    """Test that an unknown key is a miss."""
+    cache = ResponseCache(tmp_path / "cache.sqlite")
+    assert cache.get(("pplx", "sonar", "question")) is None
+
+
+def test_cache_round_trip(tmp_path: Path) -> None:
+    """Test that a stored value is returned for the same key."""
+    cache = ResponseCache(tmp_path / "cache.sqlite")
+    cache.set(("judge", "gpt-4.1", "q", "a", "m"), True)
+    assert cache.get(("judge", "gpt-4.1", "q", "a", "m")) is True
+    assert cache.get(("judge", "gpt-4.1", "q", "a", "other")) is None
+
+
+def test_cache_expired_entry_is_a_miss(tmp_path: Path) -> None:
+    """Test that entries past their TTL are not returned."""
+    cache = ResponseCache(tmp_path / "cache.sqlite")
+    cache.set(("pplx", "sonar", "question"), "answer", ttl=-1)
+    assert cache.get(("pplx", "sonar", "question")) is None
+
+
+def test_cache_persists_across_instances(tmp_path: Path) -> None:
+    """Test that a re-run reuses responses stored by a previous run."""
+    path = tmp_path / "cache.sqlite"
+    first = ResponseCache(path)
+    first.set(("pplx", "sonar", "question"), "Xin chào")
+    first.close()
+    assert ResponseCache(path).get(("pplx", "sonar", "question")) == "Xin chào"
+
+
+def test_cache_purges_expired_rows_on_open(tmp_path: Path) -> None:
+    """Test that expired entries are deleted so the file does not grow forever."""
+    path = tmp_path / "cache.sqlite"
+    first = ResponseCache(path)
+    first.set(("pplx", "sonar", "stale"), "old", ttl=-1)
+    first.set(("pplx", "sonar", "fresh"), "new")
+    first.close()
+
+    reopened = ResponseCache(path)
+    rows = reopened._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+    assert rows == (1,)
+    assert reopened.get(("pplx", "sonar", "fresh")) == "new"
+
+
+def test_cache_write_to_locked_database_is_skipped(tmp_path: Path) -> None:
+    """Test that a write the database refuses is dropped rather than raised."""
+    path = tmp_path / "cache.sqlite"
+    cache = ResponseCache(path)
+    cache._conn.close()
+    cache._conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    cache.set(("pplx", "sonar", "question"), "answer")
+    assert cache.get(("pplx", "sonar", "question")) is None
+    cache.close()
@@ -0,0 +1,35 @@
+from pathlib import Path
+
+import pytest
+
+from src.dataset import load_qa_dataset
+
+
+def test_load_qa_dataset_missing_file_raises_eagerly(tmp_path: Path) -> None:
+    """Test that a missing dataset is reported before iteration starts."""
+    with pytest.raises(FileNotFoundError):
+        load_qa_dataset(tmp_path / "missing.jsonl")
+
+
+def test_load_qa_dataset_skips_blank_and_malformed_lines(tmp_path: Path) -> None:
+    """Test that only well-formed lines are yielded."""
+    path = tmp_path / "qa.jsonl"
+    path.write_text(
+        '{"question": "Q1", "answer": "A1"}\n'
+        "\n"
+        "   \n"
+        "not json\n"
+        '{"question": "Câu hỏi", "answer": "Trả lời"}\n',
+        encoding="utf-8",
+    )
+    assert list(load_qa_dataset(path)) == [
+        {"question": "Q1", "answer": "A1"},
+        {"question": "Câu hỏi", "answer": "Trả lời"},
+    ]
+
+
+def test_load_qa_dataset_without_trailing_newline(tmp_path: Path) -> None:
+    """Test that the final line is parsed even without a newline."""
+    path = tmp_path / "qa.jsonl"
+    path.write_bytes(b'{"question": "Q1", "answer": "A1"}')
+    assert list(load_qa_dataset(path)) == [{"question": "Q1", "answer": "A1"}]
@@ -0,0 +1,310 @@
+import asyncio
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Sequence
+
+import httpx
+import pytest
+import tiktoken
+
+from src import eval as harness
+from src.cache import ResponseCache
+from src.dataset import QAItem
+from src.eval import (
+    QUESTION_BUILDERS,
+    SYSTEM_PROMPTS,
+    ExperimentMode,
+    JudgeBatcher,
+    evaluate_item,
+    is_hallucinated,
+    parse_judge_verdicts,
+)
+
+
+def test_system_prompts_cover_every_mode() -> None:
+    """Test that each experiment mode has a non-empty Perplexity system prompt."""
+    assert set(SYSTEM_PROMPTS) == set(ExperimentMode)
+    assert all(SYSTEM_PROMPTS.values())
+
+
+def test_structured_modes_request_tagged_answers() -> None:
+    """Test that the non-baseline prompts ask for the two-part XML format."""
+    for mode in (ExperimentMode.PROMPT_TUNED, ExperimentMode.RAG_ASSISTED):
+        assert "<english_answer>" in SYSTEM_PROMPTS[mode]
+        assert "<vietnamese_translation>" in SYSTEM_PROMPTS[mode]
+
+
+def test_question_builders_cover_every_mode() -> None:
+    """Test that only RAG-assisted mode adds the ground truth as context."""
+    item = QAItem(question="What is a CPU?", answer="A processor.")
+    assert set(QUESTION_BUILDERS) == set(ExperimentMode)
+    assert QUESTION_BUILDERS[ExperimentMode.BASELINE](item) == "What is a CPU?"
+    assert QUESTION_BUILDERS[ExperimentMode.PROMPT_TUNED](item) == "What is a CPU?"
+    assert QUESTION_BUILDERS[ExperimentMode.RAG_ASSISTED](item) == (
+        "CONTEXT:\n---\nA processor.\n---\n\nQUESTION: What is a CPU?"
+    )
+
+
+def test_parse_judge_verdicts_plain_lines() -> None:
+    """Test that one YES/NO per line is parsed in order."""
+    assert parse_judge_verdicts("YES\nno\n\nNO", 3) == [True, False, False]
+
+
+def test_parse_judge_verdicts_numbered_lines() -> None:
+    """Test that numbered verdicts such as '1) YES' are accepted."""
+    assert parse_judge_verdicts("1) YES\n2. NO\n3: yes", 3) == [True, False, True]
+
+
+def test_parse_judge_verdicts_count_mismatch_raises() -> None:
+    """Test that a reply missing verdicts is rejected."""
+    with pytest.raises(ValueError):
+        parse_judge_verdicts("YES\nNO", 3)
+
+
+def test_judge_batcher_groups_concurrent_requests() -> None:
+    """Test that concurrent judge calls share a single batched request."""
+    requests: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        prompt = json.loads(request.content)["messages"][-1]["content"]
+        requests.append(prompt)
+        content = "\n".join(
+            "YES" if "wrong" in line else "NO"
+            for line in prompt.splitlines()
+            if line.startswith("Model Answer: ")
+        )
+        return httpx.Response(
+            200, json={"choices": [{"message": {"content": content}}]}
+        )
+
+    async def run() -> list[bool]:
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            async with JudgeBatcher(
+                client, asyncio.Semaphore(1), batch_size=3, window=1.0
+            ) as judge:
+                return await asyncio.gather(
+                    judge.judge("Q1", "A1", "right"),
+                    judge.judge("Q2", "A2", "wrong"),
+                    judge.judge("Q3", "A3", "right"),
+                )
+
+    assert asyncio.run(run()) == [False, True, False]
+    assert len(requests) == 1
+
+
+class _LockedCache(ResponseCache):
+    """A cache whose writes fail as if another run held the database lock."""
+
+    async def aset(self, key: Sequence[Any], value: Any, ttl: float = 0) -> None:
+        raise sqlite3.OperationalError("database is locked")
+
+
+def test_judge_batcher_resolves_callers_when_cache_write_fails(
+    tmp_path: Path,
+) -> None:
+    """Test that a failing cache write neither hangs nor loses batched verdicts."""
+
+    def batch_handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, json={"choices": [{"message": {"content": "NO\nYES"}}]}
+        )
+
+    def single_handler(request: httpx.Request) -> httpx.Response:
+        event = {"choices": [{"delta": {"content": "NO"}}]}
+        return httpx.Response(
+            200,
+            content=f"data: {json.dumps(event)}\n\ndata: [DONE]\n\n".encode(),
+            headers={"content-type": "text/event-stream"},
+        )
+
+    cache = _LockedCache(tmp_path / "cache.sqlite")
+
+    async def run(handler: Any, batch_size: int) -> list[bool]:
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            async with JudgeBatcher(
+                client, asyncio.Semaphore(1), cache, batch_size=batch_size, window=1.0
+            ) as judge:
+                calls = [judge.judge(f"Q{i}", "A", "M") for i in range(batch_size)]
+                return await asyncio.wait_for(asyncio.gather(*calls), 5)
+
+    assert asyncio.run(run(batch_handler, 2)) == [False, True]
+    # The single-item path fails the verdict, as any judge error would.
+    assert asyncio.run(run(single_handler, 1)) == [True]
+    cache.close()
+
+
+def test_is_hallucinated_requests_single_biased_token(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the judge is limited to one YES/NO token when biased."""
+    monkeypatch.setattr(harness, "_verdict_logit_bias", lambda: {"1": 100, "2": 100})
+    payloads: list[dict[str, object]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payloads.append(json.loads(request.content))
+        events = [
+            {"choices": [{"delta": {"role": "assistant", "content": ""}}]},
+            {"choices": [{"delta": {"content": "NO"}}]},
+        ]
+        body = "".join(f"data: {json.dumps(event)}\n\n" for event in events)
+        return httpx.Response(
+            200,
+            content=(body + "data: [DONE]\n\n").encode(),
+            headers={"content-type": "text/event-stream"},
+        )
+
+    async def run() -> bool:
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await is_hallucinated(client, "Q", "A", "M", asyncio.Semaphore(1))
+
+    # A failed call would count as a hallucination, so NO proves it was parsed.
+    assert asyncio.run(run()) is False
+    assert payloads[0]["max_tokens"] == 1
+    assert payloads[0]["logit_bias"] == {"1": 100, "2": 100}
+    assert payloads[0]["stream"] is True
+
+
+def test_is_hallucinated_fails_stream_without_verdict(tmp_path: Path) -> None:
+    """Test that a stream with no content fails as a hallucination, uncached."""
+    event = {"choices": [{"delta": {}, "finish_reason": "content_filter"}]}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            content=f"data: {json.dumps(event)}\n\ndata: [DONE]\n\n".encode(),
+            headers={"content-type": "text/event-stream"},
+        )
+
+    cache = ResponseCache(tmp_path / "cache.sqlite")
+
+    async def run() -> bool:
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await is_hallucinated(
+                client, "Q", "A", "M", asyncio.Semaphore(1), cache
+            )
+
+    assert asyncio.run(run()) is True
+    assert cache.get(harness._judge_cache_key("Q", "A", "M")) is None
+    cache.close()
+
+
+def test_evaluate_item_skips_judge_when_perplexity_fails() -> None:
+    """Test that a failed Perplexity query is failed locally, without the judge."""
+    judged: list[httpx.Request] = []
+
+    def pplx_handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(401, json={"error": "unauthorized"})
+
+    def openai_handler(request: httpx.Request) -> httpx.Response:
+        judged.append(request)
+        return httpx.Response(200, json={"choices": [{"message": {"content": "NO"}}]})
+
+    async def run() -> tuple[QAItem, str, bool, bool]:
+        pplx = httpx.AsyncClient(transport=httpx.MockTransport(pplx_handler))
+        openai = httpx.AsyncClient(transport=httpx.MockTransport(openai_handler))
+        async with pplx, openai, JudgeBatcher(openai, asyncio.Semaphore(1)) as judge:
+            item = QAItem(question="Q", answer="A")
+            return await evaluate_item(
+                pplx, item, ExperimentMode.BASELINE, asyncio.Semaphore(1), judge
+            )
+
+    _, model_answer, hallucinated, failed = asyncio.run(run())
+    assert hallucinated is True
+    assert failed is True
+    assert "Perplexity query" in model_answer
+    assert judged == []
+
+
+def test_judge_encoding_matches_judge_model() -> None:
+    """Test that the pinned tokenizer is the one tiktoken maps the judge model to."""
+    encoding_name = tiktoken.encoding_name_for_model(harness.GPT4O_MINI_MODEL)
+    assert encoding_name == harness.JUDGE_ENCODING
+
+
+def test_verdict_logit_bias_with_real_tokenizer() -> None:
+    """Test that the real tokenizer yields one bias entry each for YES and NO."""
+    try:
+        encoding = tiktoken.get_encoding(harness.JUDGE_ENCODING)
+    except OSError:
+        pytest.skip("tokenizer cannot be downloaded")
+    harness._verdict_logit_bias.cache_clear()
+    bias = harness._verdict_logit_bias()
+    assert bias == {str(encoding.encode(w)[0]): 100 for w in ("YES", "NO")}
+    assert len(bias) == 2
+
+
+def test_judge_cache_key_tracks_prompt(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that rewording the judge prompt invalidates cached verdicts."""
+    before = harness._judge_cache_key("Q", "A", "M")
+    monkeypatch.setattr(harness, "JUDGE_SYSTEM_PROMPT", "A reworded prompt.")
+    assert harness._judge_cache_key("Q", "A", "M") != before
+
+
+def test_run_evaluation_tasks_resumes_only_current_items(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test resuming with a subset of the items, and results in dataset order."""
+    items = [QAItem(question=f"Q{i}", answer=f"A{i}") for i in range(5)]
+    asked: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content)
+        if request.url.host == "api.perplexity.ai":
+            body = request.content.decode()
+            index = next(i for i, item in enumerate(items) if item["question"] in body)
+            asked.append(items[index]["question"])
+            # Later items answer first, so completion order is reversed.
+            await asyncio.sleep((len(items) - index) * 0.01)
+            return httpx.Response(
+                200,
+                json={"choices": [{"message": {"content": "an answer"}}]},
+            )
+        if payload.get("stream"):
+            event = {"choices": [{"delta": {"content": "NO"}}]}
+            return httpx.Response(
+                200,
+                content=f"data: {json.dumps(event)}\n\ndata: [DONE]\n\n".encode(),
+                headers={"content-type": "text/event-stream"},
+            )
+        count = payload["messages"][-1]["content"].count("Model Answer: ")
+        content = "\n".join(["NO"] * count)
+        return httpx.Response(
+            200, json={"choices": [{"message": {"content": content}}]}
+        )
+
+    reported: list[list[tuple[QAItem, str, bool]]] = []
+
+    def print_results(results: list[tuple[QAItem, str, bool]], verbose: bool) -> int:
+        reported.append(results)
+        return 0
+
+    monkeypatch.setattr(
+        harness,
+        "build_client",
+        lambda name: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    monkeypatch.setattr(harness, "_print_results", print_results)
+    output = tmp_path / "results.jsonl"
+
+    def run(dataset: list[QAItem]) -> list[QAItem]:
+        asked.clear()
+        asyncio.run(
+            harness.run_evaluation_tasks(
+                iter(dataset), False, ExperimentMode.BASELINE, output=output
+            )
+        )
+        return [item for item, _, _ in reported[-1]]
+
+    assert run(items[:4]) == items[:4]
+    assert sorted(asked) == ["Q0", "Q1", "Q2", "Q3"]
+    # A --limit style subset reports only its own items, all from the file.
+    assert run(items[:2]) == items[:2]
+    assert asked == []
+    # Only the new item is asked, and the results stay in dataset order.
+    assert run(items) == items
+    assert asked == ["Q4"]
@@ -1,4 +1,4 @@
-from src.metrics import hallucination_rate
+from src.metrics import hallucination_rate, hallucination_rate_from_count
 
 
 def test_hallucination_rate_empty() -> None:
@@ -25,3 +25,19 @@ def test_hallucination_rate_single_item() -> None:
     """Test with a single item."""
     assert hallucination_rate([True]) == 100.0
     assert hallucination_rate([False]) == 0.0
+
+
+def test_hallucination_rate_tuple_input() -> None:
+    """Test that any sequence of booleans is accepted."""
+    assert hallucination_rate((True, False, False, False)) == 25.0
+
+
+def test_hallucination_rate_large_input() -> None:
+    """Test a result set large enough to span many repeated runs."""
+    assert hallucination_rate([True, False, False, False] * 250_000) == 25.0
+
+
+def test_hallucination_rate_from_count() -> None:
+    """Test the count-based rate, including an empty run."""
+    assert hallucination_rate_from_count(1, 4) == 25.0
+    assert hallucination_rate_from_count(0, 0) == 0.0
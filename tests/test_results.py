@@ -0,0 +1,60 @@
+from pathlib import Path
+
+from src.dataset import QAItem
+from src.results import append_result, load_results, open_results
+
+
+def test_load_results_missing_file_is_empty(tmp_path: Path) -> None:
+    """Test that a fresh run starts with no previous results."""
+    assert load_results(tmp_path / "results.jsonl", "baseline") == []
+
+
+def test_results_round_trip_per_mode(tmp_path: Path) -> None:
+    """Test that appended results are reloaded for their own mode only."""
+    path = tmp_path / "results.jsonl"
+    item = QAItem(question="Q1", answer="A1")
+    with open(path, "ab") as f:
+        append_result(f, "baseline", item, "model answer", True)
+        append_result(f, "rag-assisted", item, "other answer", False)
+
+    assert load_results(path, "baseline") == [(item, "model answer", True)]
+    assert load_results(path, "rag-assisted") == [(item, "other answer", False)]
+
+
+def test_load_results_ignores_truncated_line(tmp_path: Path) -> None:
+    """Test that a partial line left by a crash does not break resuming."""
+    path = tmp_path / "results.jsonl"
+    item = QAItem(question="Q1", answer="A1")
+    with open(path, "ab") as f:
+        append_result(f, "baseline", item, "model answer", False)
+        f.write(b'{"mode": "baseline", "quest')
+
+    assert load_results(path, "baseline") == [(item, "model answer", False)]
+
+
+def test_open_results_appends_after_truncated_line(tmp_path: Path) -> None:
+    """Test that a record appended after a crash is not glued to the partial line."""
+    path = tmp_path / "results.jsonl"
+    first = QAItem(question="Q1", answer="A1")
+    second = QAItem(question="Q2", answer="A2")
+    with open(path, "ab") as f:
+        append_result(f, "baseline", first, "model answer", False)
+        f.write(b'{"mode": "baseline", "quest')
+
+    with open_results(path) as f:
+        append_result(f, "baseline", second, "other answer", True)
+
+    assert load_results(path, "baseline") == [
+        (first, "model answer", False),
+        (second, "other answer", True),
+    ]
+
+
+def test_load_results_skips_failed_queries(tmp_path: Path) -> None:
+    """Test that failed queries are not treated as finished when resuming."""
+    path = tmp_path / "results.jsonl"
+    item = QAItem(question="Q1", answer="A1")
+    with open(path, "ab") as f:
+        append_result(f, "baseline", item, "query failed", True, error=True)
+
+    assert load_results(path, "baseline") == []
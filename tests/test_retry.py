@@ -0,0 +1,79 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src import retry
+from src.retry import retry_delay, with_retry
+
+
+def _response(status_code: int, headers: dict[str, str]) -> httpx.Response:
+    request = httpx.Request("POST", "https://api.example.com")
+    return httpx.Response(status_code, headers=headers, request=request)
+
+
+def test_retry_delay_honours_retry_after() -> None:
+    """Test that a Retry-After header in seconds is used verbatim."""
+    assert retry_delay(1, _response(429, {"retry-after": "7"})) == 7.0
+
+
+def test_retry_delay_uses_ratelimit_reset_when_exhausted() -> None:
+    """Test that an exhausted request quota waits for the reset window."""
+    headers = {
+        "x-ratelimit-remaining-requests": "0",
+        "x-ratelimit-reset-requests": "20s",
+    }
+    assert retry_delay(1, _response(429, headers)) == 20.0
+
+
+def test_retry_delay_caps_server_hints() -> None:
+    """Test that far-off Retry-After and reset times are capped."""
+    assert (
+        retry_delay(1, _response(429, {"retry-after": "86400"}))
+        == retry.MAX_SERVER_DELAY_SECONDS
+    )
+    headers = {
+        "x-ratelimit-remaining-requests": "0",
+        "x-ratelimit-reset-requests": "1h",
+    }
+    assert retry_delay(1, _response(429, headers)) == retry.MAX_SERVER_DELAY_SECONDS
+
+
+def test_retry_delay_backoff_is_capped() -> None:
+    """Test that the jittered backoff never exceeds the cap."""
+    for attempt in range(1, 20):
+        assert 0.0 <= retry_delay(attempt) <= retry.BACKOFF_CAP_SECONDS
+
+
+def test_with_retry_recovers_from_rate_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a 429 followed by a 200 succeeds after sleeping."""
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    monkeypatch.setattr(retry.asyncio, "sleep", fake_sleep)
+    responses = [_response(429, {"retry-after": "2"}), _response(200, {})]
+
+    async def send() -> httpx.Response:
+        return responses.pop(0).raise_for_status()
+
+    assert asyncio.run(with_retry(send)).status_code == 200
+    assert sleeps == [2.0]
+
+
+def test_with_retry_does_not_retry_client_errors(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that a non-retryable client error is raised immediately."""
+    monkeypatch.setattr(retry.asyncio, "sleep", pytest.fail)
+    calls = 0
+
+    async def send() -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return _response(401, {}).raise_for_status()
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(with_retry(send))
+    assert calls == 1